@@ -54,6 +54,11 @@ if TYPE_CHECKING:
     from google.protobuf.duration_pb2 import Duration
     from google.protobuf.field_mask_pb2 import FieldMask
 
+# Dataproc labels must conform to the following regex:
+# [a-z]([-a-z0-9]*[a-z0-9])? (current airflow version string follows
+# semantic versioning spec: x.y.z).
+_AIRFLOW_VERSION = "v" + airflow_version.replace(".", "-").replace("+", "-")
+
 
 class DataProcJobBuilder:
     """A helper class for building Dataproc job."""
@@ -72,7 +77,7 @@ class DataProcJobBuilder:
             "job": {
                 "reference": {"project_id": project_id, "job_id": name},
                 "placement": {"cluster_name": cluster_name},
-                "labels": {"airflow-version": "v" + airflow_version.replace(".", "-").replace("+", "-")},
+                "labels": {"airflow-version": _AIRFLOW_VERSION},
                 job_type: {},
             }
         }
@@ -304,11 +309,8 @@ class DataprocHook(GoogleBaseHook):
             individual attempt.
         :param metadata: Additional metadata that is provided to the method.
         """
-        # Dataproc labels must conform to the following regex:
-        # [a-z]([-a-z0-9]*[a-z0-9])? (current airflow version string follows
-        # semantic versioning spec: x.y.z).
         labels = labels or {}
-        labels.update({"airflow-version": "v" + airflow_version.replace(".", "-").replace("+", "-")})
+        labels["airflow-version"] = _AIRFLOW_VERSION
 
         cluster = {
             "project_id": project_id,
@@ -1161,11 +1163,8 @@ class DataprocAsyncHook(GoogleBaseHook):
             individual attempt.
         :param metadata: Additional metadata that is provided to the method.
         """
-        # Dataproc labels must conform to the following regex:
-        # [a-z]([-a-z0-9]*[a-z0-9])? (current airflow version string follows
-        # semantic versioning spec: x.y.z).
         labels = labels or {}
-        labels.update({"airflow-version": "v" + airflow_version.replace(".", "-").replace("+", "-")})
+        labels["airflow-version"] = _AIRFLOW_VERSION
 
         cluster = {
             "project_id": project_id,
@@ -18,6 +18,7 @@
 """This module contains Google Dataproc operators."""
 from __future__ import annotations
 
+import functools
 import inspect
 import ntpath
 import os
@@ -361,21 +362,14 @@ class ClusterGenerator:
         if self.image_version:
             cluster_data["software_config"]["image_version"] = self.image_version
 
-        elif self.custom_image:
-            project_id = self.custom_image_project_id or self.project_id
-            custom_image_url = (
-                f"https://www.googleapis.com/compute/beta/projects/{project_id}"
-                f"/global/images/{self.custom_image}"
-            )
-            cluster_data["master_config"]["image_uri"] = custom_image_url
-            if not self.single_node:
-                cluster_data["worker_config"]["image_uri"] = custom_image_url
-
-        elif self.custom_image_family:
+        elif self.custom_image or self.custom_image_family:
             project_id = self.custom_image_project_id or self.project_id
+            if self.custom_image:
+                image_path = self.custom_image
+            else:
+                image_path = f"family/{self.custom_image_family}"
             custom_image_url = (
-                "https://www.googleapis.com/compute/beta/projects/"
-                f"{project_id}/global/images/family/{self.custom_image_family}"
+                f"https://www.googleapis.com/compute/beta/projects/{project_id}/global/images/{image_path}"
             )
             cluster_data["master_config"]["image_uri"] = custom_image_url
             if not self.single_node:
@@ -419,6 +413,12 @@ class ClusterGenerator:
         return self._build_cluster_data()
 
 
+@functools.lru_cache(maxsize=None)
+def _cluster_generator_params() -> frozenset[str]:
+    """Names of the ``ClusterGenerator`` init parameters, computed once on first use."""
+    return frozenset(inspect.signature(ClusterGenerator.__init__).parameters)
+
+
 class DataprocCreateClusterOperator(GoogleCloudBaseOperator):
     """Create a new cluster on Google Cloud Dataproc.
 
@@ -538,10 +538,8 @@ class DataprocCreateClusterOperator(GoogleCloudBaseOperator):
             cluster_config = ClusterGenerator(**kwargs).make()
 
             # Remove from kwargs cluster params passed for backward compatibility
-            cluster_params = inspect.signature(ClusterGenerator.__init__).parameters
-            for arg in cluster_params:
-                if arg in kwargs:
-                    del kwargs[arg]
+            for arg in _cluster_generator_params().intersection(kwargs):
+                del kwargs[arg]
 
         super().__init__(**kwargs)
         if deferrable and polling_interval_seconds <= 0:
@@ -102,33 +102,34 @@ class AzureBaseHook(BaseHook):
         :return: the authenticated client.
         """
         conn = self.get_connection(self.conn_id)
-        tenant = conn.extra_dejson.get("tenantId")
-        if not tenant and conn.extra_dejson.get("extra__azure__tenantId"):
+        extras = conn.extra_dejson
+        tenant = extras.get("tenantId")
+        if not tenant and extras.get("extra__azure__tenantId"):
             warnings.warn(
                 "`extra__azure__tenantId` is deprecated in azure connection extra, "
                 "please use `tenantId` instead",
                 AirflowProviderDeprecationWarning,
                 stacklevel=2,
             )
-            tenant = conn.extra_dejson.get("extra__azure__tenantId")
-        subscription_id = conn.extra_dejson.get("subscriptionId")
-        if not subscription_id and conn.extra_dejson.get("extra__azure__subscriptionId"):
+            tenant = extras.get("extra__azure__tenantId")
+        subscription_id = extras.get("subscriptionId")
+        if not subscription_id and extras.get("extra__azure__subscriptionId"):
             warnings.warn(
                 "`extra__azure__subscriptionId` is deprecated in azure connection extra, "
                 "please use `subscriptionId` instead",
                 AirflowProviderDeprecationWarning,
                 stacklevel=2,
             )
-            subscription_id = conn.extra_dejson.get("extra__azure__subscriptionId")
+            subscription_id = extras.get("extra__azure__subscriptionId")
 
-        key_path = conn.extra_dejson.get("key_path")
+        key_path = extras.get("key_path")
         if key_path:
             if not key_path.endswith(".json"):
                 raise AirflowException("Unrecognised extension for key file.")
             self.log.info("Getting connection using a JSON key file.")
             return get_client_from_auth_file(client_class=self.sdk_client, auth_path=key_path)
 
-        key_json = conn.extra_dejson.get("key_json")
+        key_json = extras.get("key_json")
         if key_json:
             self.log.info("Getting connection using a JSON config.")
             return get_client_from_json_dict(client_class=self.sdk_client, config_dict=key_json)